@@ -3,218 +3,652 @@
 Personal Security Guardian Monitor
 
 Continuously monitors:
-- Listening network ports (ss -tulpen)
-- Running processes (ps aux)
-- Git repository states (git status -sb)
+- Listening network ports (/proc/net/tcp, udp and their v6 variants)
+- Running processes (/proc/<pid>/status and cmdline)
+- Git repository states (git status --porcelain=v2 --branch)
 
 Compares to known-good baselines and alerts on deviations.
-Logs all results to references/security-log.md (append-only).
+Logs all results to references/security-log.jsonl (append-only, one JSON
+object per line).
 Sends Telegram alerts if --target is configured.
+With --daemon, keeps running: full scans on an interval, plus immediate
+rechecks when a watched repo's HEAD or branch refs change (inotify).
 """
 
+import asyncio
+import atexit
+import ctypes
+import ctypes.util
 import os
 import json
+import pickle
+import pwd
+import re
+import select
+import struct
 import subprocess
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Config
 SCRIPT_DIR = Path(__file__).parent.parent
 BASELINES_DIR = SCRIPT_DIR / "references" / "baselines"
-SECURITY_LOG = SCRIPT_DIR / "references" / "security-log.md"
+SECURITY_LOG = SCRIPT_DIR / "references" / "security-log.jsonl"
+REPO_CACHE = SCRIPT_DIR / "references" / "repo-list.cache.json"
+REPO_CACHE_MAX_AGE = 24 * 60 * 60  # Seconds before a full re-walk is forced
+REPO_SCAN_PRUNE = {
+    ".git", "node_modules", ".venv", "venv", "__pycache__",
+    "target", "dist", "build", ".tox", ".cache",
+}
 TELEGRAM_TARGET = "7642182046"  # Default; can be overridden
+TELEGRAM_ALERT_PREFIX = "[SECURITY ALERT]\n"
+TELEGRAM_MAX_CHARS = 4096  # Telegram's per-message text limit
+BASELINE_FORMAT = "pickle"  # "pickle" (JSON kept alongside) or "json"
+BASELINE_SCHEMA_VERSION = 1  # Bump when the pickled baseline layout changes
+GIT_MAX_CONCURRENCY = 32  # In-flight git subprocesses
+REPO_STATE_MAX_AGE = 15 * 60  # Seconds an unchanged repo may skip git status
+DAEMON_SCAN_INTERVAL = 300  # Seconds between full scans in --daemon mode
+DAEMON_EVENT_SETTLE = 1.0  # Seconds to let a burst of git ref writes finish
+
+# inotify(7) event masks used by --daemon
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+
+# /proc/net tables to scan: (file, protocol, socket state). TCP sockets are
+# listening in state 0A (LISTEN); bound UDP sockets sit in 07 (unconnected).
+PROC_NET_TABLES = [
+    ("tcp", "TCP", b"0A"),
+    ("tcp6", "TCP", b"0A"),
+    ("udp", "UDP", b"07"),
+    ("udp6", "UDP", b"07"),
+]
+PROC_READ_BUFFER = 1 << 16  # Read size for streaming /proc/net tables
+
+# "sl local_address rem_address st ..." -> (local port hex, state hex)
+_PROC_NET_RE = re.compile(rb"\s*\d+:\s+[0-9A-F]+:([0-9A-F]+)\s+[0-9A-F]+:[0-9A-F]+\s+([0-9A-F]{2})\s")
 
 # Ensure directories exist
 BASELINES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Log entries are buffered and appended once per run (see flush_log)
+_LOG_BUFFER: list[str] = []
+_LOG_FD = os.open(str(SECURITY_LOG), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
-def log_event(event_type: str, details: str, status: str = "OK", action: str = ""):
-    """Append event to security-log.md with timestamp."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    
-    entry = f"""
-### [{timestamp}] {event_type}
+# Parsed baselines keyed by file path -> (file mtime_ns, data)
+_BASELINE_CACHE: dict[str, tuple[int, object]] = {}
 
-**Event Type:** {event_type}  
-**Details:** {details}  
-**Status:** {status}  
-**Action:** {action or "(none)"}
-"""
-    
-    with open(SECURITY_LOG, "a") as f:
-        f.write(entry + "\n")
+# Last git result per repo path -> (signature from _repo_signature, monotonic time, state)
+_REPO_STATE_CACHE: dict[str, tuple[tuple, float, dict]] = {}
+
+# Last diff per baseline name -> (current, baseline, new, gone)
+_DIFF_CACHE: dict[str, tuple[frozenset, frozenset, frozenset, frozenset]] = {}
+
+
+def log_event(event_type: str, details: str, status: str = "OK", action: str = ""):
+    """Queue a JSONL event for security-log.jsonl (written by flush_log)."""
+    entry = {
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "type": event_type,
+        "details": details,
+        "status": status,
+        "action": action or None,
+    }
+    _LOG_BUFFER.append(json.dumps(entry) + "\n")
     
     print(f"[LOG] {event_type}: {status}")
 
 
+def flush_log():
+    """Append buffered entries to security-log.jsonl with one write() call.
+
+    _LOG_FD is opened with O_APPEND, so concurrent monitors never interleave
+    or overwrite each other's lines.
+    """
+    if not _LOG_BUFFER:
+        return
+    data = "".join(_LOG_BUFFER).encode()
+    _LOG_BUFFER.clear()
+    while data:
+        written = os.write(_LOG_FD, data)
+        data = data[written:]
+
+
+atexit.register(flush_log)
+
+
 def send_telegram_alert(alert_text: str):
-    """Send alert to Telegram (if available)."""
+    """Send alert to Telegram (if available). Returns True if it was sent."""
     try:
         # Use OpenClaw message tool via subprocess if available
         cmd = [
             "openclaw", "message", "send",
             "--to", TELEGRAM_TARGET,
-            "--message", f"[SECURITY ALERT]\n{alert_text}"
+            "--message", f"{TELEGRAM_ALERT_PREFIX}{alert_text}"
         ]
         result = subprocess.run(cmd, capture_output=True, timeout=5)
         if result.returncode == 0:
             print(f"[ALERT SENT] {alert_text[:50]}...")
-        else:
-            print(f"[ALERT FAILED] Could not send via OpenClaw: {result.stderr.decode()}")
+            return True
+        print(f"[ALERT FAILED] Could not send via OpenClaw: {result.stderr.decode()}")
     except Exception as e:
         print(f"[ALERT FAILED] {e}")
+    return False
+
+
+def chunk_alerts(alerts, separator: str = "\n---\n"):
+    """Join alerts into as few messages as fit Telegram's length limit.
+
+    Returns (message, alerts) pairs, where alerts are the ones with text in
+    that message. An alert longer than the limit on its own is split across
+    messages.
+    """
+    limit = TELEGRAM_MAX_CHARS - len(TELEGRAM_ALERT_PREFIX)
+    pieces = []
+    for alert in alerts:
+        pieces.extend((alert[i:i + limit], alert) for i in range(0, len(alert), limit))
+    
+    chunks = []
+    for piece, alert in pieces:
+        if chunks and len(chunks[-1][0]) + len(separator) + len(piece) <= limit:
+            chunks[-1][0] += separator + piece
+            chunks[-1][1].add(alert)
+        else:
+            chunks.append([piece, {alert}])
+    return [tuple(chunk) for chunk in chunks]
 
 
 def get_listening_ports():
-    """Get all listening TCP/UDP ports via ss -tulpen."""
+    """Get all listening TCP/UDP ports from /proc/net (no ss subprocess)."""
     try:
-        result = subprocess.run(
-            ["ss", "-tulpen"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        ports = {}
-        for line in result.stdout.split("\n"):
-            if not line.strip() or "LISTEN" not in line:
-                continue
+        ports = set()
+        for table, proto, state in PROC_NET_TABLES:
+            try:
+                f = open(f"/proc/net/{table}", "rb", buffering=PROC_READ_BUFFER)
+            except FileNotFoundError:
+                continue  # e.g. IPv6 disabled
             
-            parts = line.split()
-            for part in parts:
-                if ":" in part and "/" in part:  # e.g., "0.0.0.0:22/tcp"
-                    addr_port = part.split("/")[0]
-                    proto = part.split("/")[1]
-                    port = addr_port.split(":")[-1]
-                    key = f"{port}/{proto.upper()}"
-                    ports[key] = True
+            # Parse line by line as the kernel produces them instead of
+            # materializing the whole table and a list of its lines.
+            with f:
+                next(f, None)  # Skip header
+                for line in f:
+                    m = _PROC_NET_RE.match(line)
+                    if m is None or m.group(2) != state:
+                        continue
+                    port = int(m.group(1), 16)
+                    ports.add(f"{port}/{proto}")
         
-        return sorted(ports.keys())
+        return frozenset(ports)
     except Exception as e:
         log_event("PORTS_CHECK", f"Failed to read ports: {e}", "ERROR", "Manual review required")
-        return []
+        return frozenset()
+
+
+def _read_process_key(pid: str, users: dict):
+    """Build the "user:command" key for one /proc entry.
+
+    The user is the full effective username (ps aux truncated names longer
+    than 8 characters, e.g. "systemd+"). The command is argv[0] as ps printed
+    it, or "[comm]" for kernel threads.
+    Files are read as bytes; only the command we keep gets decoded.
+    """
+    with open(f"/proc/{pid}/status", "rb") as f:
+        uid_line = next(line for line in f if line.startswith(b"Uid:"))
+    uid = int(uid_line.split()[2])  # Effective UID, like ps's USER column
+    
+    user = users.get(uid)
+    if user is None:  # Not enumerable (e.g. LDAP without enumeration)
+        try:
+            user = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            user = str(uid)
+        users[uid] = user
+    
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        argv0 = f.read().split(b"\0", 1)[0].split()
+    if argv0:
+        cmd = argv0[0].decode(errors="replace")
+    else:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            cmd = f"[{f.read().strip().decode(errors='replace')}]"
+    
+    return f"{user}:{cmd}"  # e.g., "bob:python"
 
 
 def get_running_processes():
-    """Get running processes (command + user + pid) via ps aux."""
+    """Get running processes (user + command) by walking /proc directly."""
     try:
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        processes = {}
-        for idx, line in enumerate(result.stdout.split("\n")):
-            if not line.strip() or idx == 0:  # Skip header
-                continue
-            parts = line.split(None, 10)  # Split into ~11 fields
-            if len(parts) < 11:
-                continue
-            
-            try:
-                user, pid, cmd = parts[0], parts[1], parts[10]
-                pid = int(pid)  # Validate it's an integer
-                key = f"{user}:{cmd.split()[0]}"  # e.g., "bob:python"
-                processes[key] = pid
-            except (ValueError, IndexError):
-                continue
+        processes = set()
+        # UID -> username for the whole scan, loaded with one NSS enumeration.
+        # setdefault keeps the first entry per UID, as getpwuid would.
+        users = {}
+        for entry in pwd.getpwall():
+            users.setdefault(entry.pw_uid, entry.pw_name)
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    key = _read_process_key(entry.name, users)
+                except (OSError, StopIteration, ValueError, IndexError):
+                    continue  # Process exited mid-scan or is hidden from us
+                processes.add(key)
         
-        return sorted(processes.keys())
+        return frozenset(processes)
     except Exception as e:
         log_event("PROCESSES_CHECK", f"Failed to read processes: {e}", "ERROR", "Manual review required")
-        return []
+        return frozenset()
 
 
-def get_git_repos():
-    """Scan common git directories and capture status."""
-    git_repos = {}
+def _parse_porcelain_v2(output: str):
+    """Split `git status --porcelain=v2 --branch` into (status, last_commit).
+
+    The status is summarized as a "## branch...upstream [ahead N, behind M]"
+    header followed by counts of modified/unmerged/untracked paths.
+    """
+    headers = {}
+    counts = {"modified": 0, "unmerged": 0, "untracked": 0}
+    for line in output.splitlines():
+        if line.startswith("# "):
+            key, _, value = line[2:].partition(" ")
+            headers[key] = value
+        elif line.startswith(("1 ", "2 ")):
+            counts["modified"] += 1
+        elif line.startswith("u "):
+            counts["unmerged"] += 1
+        elif line.startswith("? "):
+            counts["untracked"] += 1
+    
+    oid = headers.get("branch.oid", "(initial)")
+    head = headers.get("branch.head", "(detached)")
+    if oid == "(initial)":
+        status = f"## No commits yet on {head}"
+    elif head == "(detached)":
+        status = "## HEAD (no branch)"
+    else:
+        status = f"## {head}"
+    
+    if "branch.upstream" in headers:
+        status += f"...{headers['branch.upstream']}"
+        ahead, _, behind = headers.get("branch.ab", "+0 -0").partition(" ")
+        tracking = []
+        if ahead.lstrip("+") != "0":
+            tracking.append(f"ahead {ahead.lstrip('+')}")
+        if behind.lstrip("-") != "0":
+            tracking.append(f"behind {behind.lstrip('-')}")
+        if tracking:
+            status += f" [{', '.join(tracking)}]"
+    
+    summary = ", ".join(f"{n} {kind}" for kind, n in counts.items() if n)
+    if summary:
+        status += f"\n{summary}"
+    
+    last_commit = "unknown" if oid == "(initial)" else oid
+    return status, last_commit
+
+
+def _repo_signature(repo_path: Path):
+    """mtimes of the git files a commit, checkout or staging would touch.
+
+    Returns None when .git isn't a plain readable directory (worktrees,
+    submodules, permission errors), in which case the repo is always rescanned.
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_bytes()
+        sig = [(git_dir / "HEAD").stat().st_mtime_ns]
+    except OSError:
+        return None
+    ref_files = ["index", "packed-refs"]
+    if head.startswith(b"ref: "):
+        ref_files.append(head[5:].strip().decode(errors="replace"))
+    for ref_file in ref_files:
+        try:
+            sig.append((git_dir / ref_file).stat().st_mtime_ns)
+        except OSError:
+            sig.append(0)
+    return tuple(sig)
+
+
+async def _git_status_for(repo_path: Path, limit: asyncio.Semaphore):
+    """Capture status and HEAD commit for a single repo (None on failure).
+
+    If HEAD, the index, packed-refs and the current branch ref all have the
+    same mtimes as on the last scan, the previous result is reused without
+    running git. Unstaged edits don't touch any of those files, so a cached
+    result is only trusted for REPO_STATE_MAX_AGE seconds.
+    """
+    signature = _repo_signature(repo_path)
+    cached = _REPO_STATE_CACHE.get(str(repo_path))
+    if (
+        signature is not None
+        and cached is not None
+        and cached[0] == signature
+        and time.monotonic() - cached[1] < REPO_STATE_MAX_AGE
+    ):
+        return cached[2]
     
-    # Common locations
-    search_paths = [
+    async with limit:
+        proc = None
+        try:
+            # One call gives both the working tree state and the HEAD commit
+            proc = await asyncio.create_subprocess_exec(
+                "git", "-C", str(repo_path), "status", "--porcelain=v2", "--branch",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+            
+            if proc.returncode == 0:
+                status, last_commit = _parse_porcelain_v2(stdout.decode(errors="replace"))
+                repo_state = {
+                    "status": status,
+                    "last_commit": last_commit[:8]
+                }
+                if signature is not None:
+                    _REPO_STATE_CACHE[str(repo_path)] = (signature, time.monotonic(), repo_state)
+                return repo_state
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print(f"[GIT] Timed out reading {repo_path}")
+        except Exception as e:
+            print(f"[GIT] Error reading {repo_path}: {e}")
+        return None
+
+
+async def _git_status_all(repo_paths):
+    """Run git status for every repo on one event loop, capped in flight."""
+    limit = asyncio.Semaphore(GIT_MAX_CONCURRENCY)
+    states = await asyncio.gather(*(_git_status_for(repo, limit) for repo in repo_paths))
+    return {
+        str(repo): state
+        for repo, state in zip(repo_paths, states)
+        if state is not None
+    }
+
+
+def _find_repos(base_path: Path):
+    """Yield repo roots under base_path, skipping dependency/build trees.
+
+    Pruning dirnames in place stops os.walk before it descends. A directory
+    with a pruned name is still entered if it is itself a repo (a project
+    called "build" or "dist"). The walk continues below a found repo so
+    nested repos (and a dotfiles repo at $HOME) don't hide the ones inside
+    them.
+    """
+    for root, dirnames, filenames in os.walk(base_path):
+        if ".git" in dirnames or ".git" in filenames:
+            yield Path(root)
+        dirnames[:] = [
+            d for d in dirnames
+            if d != ".git" and (
+                d not in REPO_SCAN_PRUNE
+                or os.path.lexists(os.path.join(root, d, ".git"))
+            )
+        ]
+
+
+def _discover_repos(search_paths, rescan: bool = False):
+    """Return repo roots, re-walking the search paths only when needed.
+
+    The discovered list is cached in REPO_CACHE together with the mtime of
+    each search root. A full walk happens on --rescan, when a root's mtime
+    changed, or when the cache is older than REPO_CACHE_MAX_AGE.
+    """
+    roots = {str(p): p.stat().st_mtime for p in search_paths if p.exists()}
+    
+    if not rescan and REPO_CACHE.exists():
+        try:
+            with open(REPO_CACHE, "r") as f:
+                cache = json.load(f)
+            fresh = datetime.now(timezone.utc).timestamp() - cache["scanned_at"] < REPO_CACHE_MAX_AGE
+            if fresh and cache["roots"] == roots:
+                return [Path(p) for p in cache["repos"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Corrupt or old cache: fall through to a full walk
+    
+    # Roots inside another root are already covered by its walk. Compare
+    # resolved paths: os.walk doesn't follow symlinks, so a symlinked
+    # ~/code pointing elsewhere still gets its own walk.
+    # Repo keys keep the unresolved path so they match existing baselines.
+    walk_roots = {}  # resolved path -> path as given
+    for root in sorted(roots, key=lambda r: len(Path(r).resolve().parts)):
+        resolved = Path(root).resolve()
+        if not any(resolved.is_relative_to(other) for other in walk_roots):
+            walk_roots[resolved] = Path(root)
+    
+    # dict keeps discovery order, drops duplicates
+    repo_paths = {}
+    for root in walk_roots.values():
+        for repo_path in _find_repos(root):
+            repo_paths[str(repo_path)] = True
+    
+    cache = {
+        "scanned_at": datetime.now(timezone.utc).timestamp(),
+        "roots": roots,
+        "repos": list(repo_paths),
+    }
+    tmp_file = REPO_CACHE.with_suffix(".tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, REPO_CACHE)
+    except OSError as e:
+        print(f"[GIT] Could not write repo cache: {e}")
+    
+    return [Path(p) for p in repo_paths]
+
+
+def _search_paths():
+    """Common locations to look for git repos."""
+    return [
         Path.home(),
         Path.home() / "code",
         Path.home() / "projects",
         Path.home() / ".openclaw",
     ]
+
+
+def get_git_repos(rescan: bool = False):
+    """Scan common git directories and capture status."""
+    repo_paths = _discover_repos(_search_paths(), rescan)
     
-    for base_path in search_paths:
-        if not base_path.exists():
+    # git calls are subprocess waits; drive them all from one thread via
+    # asyncio, with a semaphore so we don't run out of file descriptors.
+    return asyncio.run(_git_status_all(repo_paths))
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
+
+def save_baseline(name: str, data, pretty: bool = False):
+    """Save baseline as JSON, plus a pickled copy when BASELINE_FORMAT is "pickle".
+
+    JSON is written compact unless pretty is set (sets become sorted lists);
+    the pickle holds the ready-to-diff frozenset/dict for fast loading.
+    """
+    baseline_file = BASELINES_DIR / f"{name}.baseline.json"
+    if isinstance(data, (set, frozenset, list)):
+        compiled = frozenset(data)
+        data = sorted(data)
+    else:
+        compiled = data
+    if pretty:
+        text = json.dumps(data, indent=2)
+    else:
+        text = json.dumps(data, separators=(",", ":"))
+    _write_atomic(baseline_file, text.encode())
+    print(f"[BASELINE] Saved {baseline_file}")
+    
+    if BASELINE_FORMAT == "pickle":
+        # Written after the JSON so its mtime marks it as current
+        pickle_file = BASELINES_DIR / f"{name}.baseline.pkl"
+        payload = {"v": BASELINE_SCHEMA_VERSION, "data": compiled}
+        _write_atomic(pickle_file, pickle.dumps(payload, protocol=5))
+
+
+class _BaselineUnpickler(pickle.Unpickler):
+    """Unpickler that refuses every global.
+
+    Baselines only hold dicts, strings and frozensets, which pickle encodes
+    without importing anything, so a tampered file can't run code.
+    """
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Refusing to load {module}.{name} from baseline")
+
+
+def _read_baseline_pickle(baseline_file: Path):
+    with open(baseline_file, "rb") as f:
+        payload = _BaselineUnpickler(f).load()
+    if not isinstance(payload, dict) or payload.get("v") != BASELINE_SCHEMA_VERSION:
+        raise ValueError("unsupported baseline schema version")
+    return payload["data"]
+
+
+def _read_baseline_json(baseline_file: Path):
+    with open(baseline_file, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = frozenset(data)
+    return data
+
+
+def load_baseline(name: str):
+    """Load baseline, reusing the parsed copy if the file is unchanged.
+
+    Prefers the pickled copy unless the JSON is newer (e.g. edited by hand)
+    or missing (deleted to reset it), and falls back to JSON if the pickle
+    can't be read. List baselines
+    (ports, processes) come back as frozensets so they can be diffed directly.
+    """
+    json_file = BASELINES_DIR / f"{name}.baseline.json"
+    pickle_file = BASELINES_DIR / f"{name}.baseline.pkl"
+    try:
+        json_mtime = json_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        json_mtime = None
+    
+    sources = [(json_file, json_mtime, _read_baseline_json)]
+    if BASELINE_FORMAT == "pickle":
+        try:
+            pickle_mtime = pickle_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            pickle_mtime = None
+        if pickle_mtime is not None and json_mtime is not None and pickle_mtime >= json_mtime:
+            sources.insert(0, (pickle_file, pickle_mtime, _read_baseline_pickle))
+    
+    for baseline_file, mtime, reader in sources:
+        if mtime is None:
             continue
+        cached = _BASELINE_CACHE.get(str(baseline_file))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         
-        # Find .git directories
-        for git_dir in base_path.rglob(".git"):
-            repo_path = git_dir.parent
+        if reader is _read_baseline_pickle:
             try:
-                result = subprocess.run(
-                    ["git", "-C", str(repo_path), "status", "-sb"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                # Also get last commit hash
-                result_hash = subprocess.run(
-                    ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0:
-                    status = result.stdout.strip()
-                    last_commit = result_hash.stdout.strip() if result_hash.returncode == 0 else "unknown"
-                    git_repos[str(repo_path)] = {
-                        "status": status,
-                        "last_commit": last_commit[:8]
-                    }
+                data = reader(baseline_file)
             except Exception as e:
-                print(f"[GIT] Error reading {repo_path}: {e}")
+                print(f"[BASELINE] Ignoring {baseline_file.name}: {e}")
+                continue
+        else:
+            data = reader(baseline_file)
+        _BASELINE_CACHE[str(baseline_file)] = (mtime, data)
+        return data
     
-    return git_repos
-
+    return None
 
-def save_baseline(name: str, data):
-    """Save baseline to JSON file."""
-    baseline_file = BASELINES_DIR / f"{name}.baseline.json"
-    with open(baseline_file, "w") as f:
-        json.dump(data, f, indent=2)
-    print(f"[BASELINE] Saved {baseline_file}")
 
+def diff_against_baseline(name: str, current: frozenset, baseline: frozenset):
+    """Return (new, gone) items, reusing the last result if nothing changed.
 
-def load_baseline(name: str):
-    """Load baseline from JSON file."""
-    baseline_file = BASELINES_DIR / f"{name}.baseline.json"
-    if not baseline_file.exists():
-        return None
+    A cycle whose current set hashes and compares equal to the previous one,
+    against the same baseline object, skips the set differences entirely.
+    """
+    cached = _DIFF_CACHE.get(name)
+    if (
+        cached is not None
+        and cached[1] is baseline
+        and hash(cached[0]) == hash(current)
+        and cached[0] == current
+    ):
+        return cached[2], cached[3]
     
-    with open(baseline_file, "r") as f:
-        return json.load(f)
+    new = current - baseline
+    gone = baseline - current
+    _DIFF_CACHE[name] = (current, baseline, new, gone)
+    return new, gone
+
+
+def capture_current_state(rescan: bool = False):
+    """Collect ports, processes and git repos concurrently.
+
+    The three scans are independent and mostly wait on I/O, so total time is
+    the slowest scan rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_ports = executor.submit(get_listening_ports)
+        f_procs = executor.submit(get_running_processes)
+        f_repos = executor.submit(get_git_repos, rescan)
+        return f_ports.result(), f_procs.result(), f_repos.result()
+
+
+def check_repo(repo_path: str, repo_state: dict, baseline_state):
+    """Compare one repo to its baseline; log and return the alert text, if any."""
+    if baseline_state is None:
+        # New repo
+        log_event("GIT_NEW_REPO", repo_path, "ALERT", "User approval needed")
+        return f"New Git Repo Detected: {repo_path}"
+    if baseline_state.get("last_commit") != repo_state.get("last_commit"):
+        # Unexpected commit
+        log_event("GIT_UNEXPECTED_COMMIT", f"{repo_path}: commit mismatch", "ALERT", "Immediate review required")
+        return f"Git Repo Changed: {repo_path}\nOld: {baseline_state.get('last_commit')}\nNew: {repo_state.get('last_commit')}"
+    if "modified" in repo_state.get("status", "") or "ahead" in repo_state.get("status", ""):
+        if "modified" in baseline_state.get("status", "") or "ahead" in baseline_state.get("status", ""):
+            return None  # Expected state
+        log_event("GIT_STATUS_CHANGE", f"{repo_path}: {repo_state.get('status')}", "ALERT", "Review needed")
+        return f"Git Repo Status Changed: {repo_path}\nStatus: {repo_state.get('status')}"
+    return None
 
 
-def compare_baselines():
-    """Run full monitoring check."""
+def compare_baselines(rescan: bool = False, pretty: bool = False, sent_alerts: set = None):
+    """Run full monitoring check.
+
+    With sent_alerts (used by --daemon), only alerts not already in the set
+    are sent to Telegram, and the set is updated to this cycle's delivered
+    alerts: a deviation that clears and later returns is sent again, and one
+    whose send failed is retried next cycle.
+    """
     print("\n=== Personal Security Guardian Monitor ===\n")
     
     # Get current state
-    ports_now = get_listening_ports()
-    procs_now = get_running_processes()
-    repos_now = get_git_repos()
+    ports_now, procs_now, repos_now = capture_current_state(rescan)
     
     # Load baselines
-    ports_baseline = load_baseline("ports") or []
-    procs_baseline = load_baseline("processes") or []
+    ports_baseline = load_baseline("ports") or frozenset()
+    procs_baseline = load_baseline("processes") or frozenset()
     repos_baseline = load_baseline("git-repos") or {}
     
     # First run: no baseline yet
     if not ports_baseline and not procs_baseline and not repos_baseline:
         print("[INIT] First run — creating baselines...\n")
-        save_baseline("ports", ports_now)
-        save_baseline("processes", procs_now)
-        save_baseline("git-repos", repos_now)
+        save_baseline("ports", ports_now, pretty)
+        save_baseline("processes", procs_now, pretty)
+        save_baseline("git-repos", repos_now, pretty)
         log_event(
             "BASELINE_INIT",
             f"Captured {len(ports_now)} ports, {len(procs_now)} processes, {len(repos_now)} repos",
@@ -231,8 +665,7 @@ def compare_baselines():
     alerts = []
     
     # Check ports
-    ports_new = set(ports_now) - set(ports_baseline)
-    ports_gone = set(ports_baseline) - set(ports_now)
+    ports_new, ports_gone = diff_against_baseline("ports", ports_now, ports_baseline)
     if ports_new or ports_gone:
         details = ""
         if ports_new:
@@ -244,8 +677,7 @@ def compare_baselines():
         log_event("PORTS_DEVIATION", details, "ALERT", "User investigation required")
     
     # Check processes
-    procs_new = set(procs_now) - set(procs_baseline)
-    procs_gone = set(procs_baseline) - set(procs_now)
+    procs_new, procs_gone = diff_against_baseline("processes", procs_now, procs_baseline)
     if procs_new or procs_gone:
         details = ""
         if procs_new:
@@ -258,50 +690,43 @@ def compare_baselines():
     
     # Check git repos
     for repo_path, repo_state in repos_now.items():
-        baseline_state = repos_baseline.get(repo_path)
-        if baseline_state is None:
-            # New repo
-            alert = f"New Git Repo Detected: {repo_path}"
-            alerts.append(alert)
-            log_event("GIT_NEW_REPO", repo_path, "ALERT", "User approval needed")
-        elif baseline_state.get("last_commit") != repo_state.get("last_commit"):
-            # Unexpected commit
-            alert = f"Git Repo Changed: {repo_path}\nOld: {baseline_state.get('last_commit')}\nNew: {repo_state.get('last_commit')}"
+        alert = check_repo(repo_path, repo_state, repos_baseline.get(repo_path))
+        if alert:
             alerts.append(alert)
-            log_event("GIT_UNEXPECTED_COMMIT", f"{repo_path}: commit mismatch", "ALERT", "Immediate review required")
-        elif "modified" in repo_state.get("status", "") or "ahead" in repo_state.get("status", ""):
-            if "modified" in baseline_state.get("status", "") or "ahead" in baseline_state.get("status", ""):
-                pass  # Expected state
-            else:
-                alert = f"Git Repo Status Changed: {repo_path}\nStatus: {repo_state.get('status')}"
-                alerts.append(alert)
-                log_event("GIT_STATUS_CHANGE", f"{repo_path}: {repo_state.get('status')}", "ALERT", "Review needed")
     
     # Report
+    failed = set()
     if alerts:
         print(f"\n⚠️  {len(alerts)} DEVIATION(S) DETECTED:\n")
         for alert in alerts:
             print(f"  - {alert}\n")
-            send_telegram_alert(alert)
+        to_send = alerts if sent_alerts is None else [a for a in alerts if a not in sent_alerts]
+        # Batched so K alerts cost a few sends, not K timeouts
+        for message, included in chunk_alerts(to_send):
+            if not send_telegram_alert(message):
+                failed.update(included)
         
-        print("\n→ Review security-log.md for details")
+        print("\n→ Review security-log.jsonl for details")
         print("→ Investigate and approve baseline updates when ready")
     else:
         print("\n✓ All clear — no deviations from baseline")
         log_event("MONITORING_CYCLE", "No deviations detected", "OK", "System secure")
+    
+    if sent_alerts is not None:
+        sent_alerts.clear()
+        sent_alerts.update(a for a in alerts if a not in failed)
 
 
-def approve_baseline():
+def approve_baseline(pretty: bool = False):
     """Update baselines to current state."""
     print("\n=== Approving Baseline Updates ===\n")
     
-    ports_now = get_listening_ports()
-    procs_now = get_running_processes()
-    repos_now = get_git_repos()
+    # Never approve from a stale repo list
+    ports_now, procs_now, repos_now = capture_current_state(rescan=True)
     
-    save_baseline("ports", ports_now)
-    save_baseline("processes", procs_now)
-    save_baseline("git-repos", repos_now)
+    save_baseline("ports", ports_now, pretty)
+    save_baseline("processes", procs_now, pretty)
+    save_baseline("git-repos", repos_now, pretty)
     
     log_event(
         "BASELINE_UPDATE_APPROVED",
@@ -312,11 +737,139 @@ def approve_baseline():
     print("\n✓ Baselines updated and approved!")
 
 
+class _Inotify:
+    """Minimal inotify(7) wrapper over libc via ctypes (Linux only)."""
+    
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+    
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+    
+    def read_events(self):
+        """Drain pending events as (wd, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buf):
+                # struct inotify_event { int wd; u32 mask, cookie, len; char name[]; }
+                wd, mask, _, length = struct.unpack_from("iIII", buf, offset)
+                offset += 16
+                name = buf[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                events.append((wd, mask, name))
+
+
+def _watch_repo(inotify: _Inotify, watches: dict, repo_path: Path):
+    """Watch a repo's HEAD/packed-refs and branch refs; returns False if not watchable."""
+    git_dir = repo_path / ".git"
+    try:
+        # git updates these via lock file + rename, so IN_MOVED_TO covers most writes
+        wd = inotify.add_watch(git_dir, IN_MOVED_TO | IN_CREATE | IN_CLOSE_WRITE)
+        watches[wd] = (repo_path, {"HEAD", "packed-refs"})
+        wd = inotify.add_watch(git_dir / "refs" / "heads", IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY)
+        watches[wd] = (repo_path, None)  # Any branch ref
+    except OSError as e:
+        print(f"[DAEMON] Not watching {repo_path}: {e}")
+        return False
+    return True
+
+
+def recheck_repo(repo_path: Path, sent_alerts: set):
+    """Re-run git status for one repo and alert if it deviates from baseline.
+
+    Alerts already in sent_alerts are not sent to Telegram again.
+    """
+    repo_state = asyncio.run(_git_status_all([repo_path])).get(str(repo_path))
+    if repo_state is None:
+        return  # Removed, or git failed (already reported)
+    repos_baseline = load_baseline("git-repos") or {}
+    alert = check_repo(str(repo_path), repo_state, repos_baseline.get(str(repo_path)))
+    if alert:
+        print(f"\n⚠️  DEVIATION DETECTED:\n\n  - {alert}\n")
+        if alert not in sent_alerts:
+            sent = [send_telegram_alert(message) for message, _ in chunk_alerts([alert])]
+            if all(sent):
+                sent_alerts.add(alert)
+
+
+def monitor_daemon(rescan: bool = False, pretty: bool = False):
+    """Keep monitoring until interrupted.
+
+    Ports and processes have no unprivileged change notification, so they
+    are rescanned every DAEMON_SCAN_INTERVAL seconds along with everything
+    else. In between, inotify on each repo's HEAD and branch refs triggers
+    an immediate recheck of just that repo.
+    """
+    inotify = _Inotify()
+    watches = {}  # wd -> (repo path, event names of interest or None for any)
+    watched = set()
+    sent_alerts = set()  # Alerts already delivered; only new/changed ones are sent
+    print(f"[DAEMON] Full scan every {DAEMON_SCAN_INTERVAL}s, git refs watched in between")
+    
+    try:
+        while True:
+            # A failed cycle (e.g. a baseline mid-rewrite) must not stop the daemon
+            try:
+                compare_baselines(rescan, pretty, sent_alerts)
+                rescan = False
+                
+                for repo_path in _discover_repos(_search_paths()):
+                    if repo_path not in watched and _watch_repo(inotify, watches, repo_path):
+                        watched.add(repo_path)
+            except Exception as e:
+                log_event("DAEMON_ERROR", f"Monitoring cycle failed: {e}", "ERROR", "Retrying next cycle")
+            flush_log()
+            
+            deadline = time.monotonic() + DAEMON_SCAN_INTERVAL
+            while (remaining := deadline - time.monotonic()) > 0:
+                ready, _, _ = select.select([inotify.fd], [], [], remaining)
+                if not ready:
+                    break
+                time.sleep(DAEMON_EVENT_SETTLE)  # Let git finish its ref updates
+                
+                changed = set()
+                for wd, mask, name in inotify.read_events():
+                    if mask & IN_IGNORED:
+                        # Watch gone (dir deleted); re-added on the next full scan
+                        repo_path, _ = watches.pop(wd, (None, None))
+                        watched.discard(repo_path)
+                        continue
+                    entry = watches.get(wd)
+                    if entry is not None and (entry[1] is None or name in entry[1]):
+                        changed.add(entry[0])
+                
+                for repo_path in changed:
+                    try:
+                        recheck_repo(repo_path, sent_alerts)
+                    except Exception as e:
+                        log_event("DAEMON_ERROR", f"Recheck of {repo_path} failed: {e}", "ERROR", "Retrying next cycle")
+                flush_log()
+    except KeyboardInterrupt:
+        print("\n[DAEMON] Stopped")
+
+
 def main():
-    if len(sys.argv) > 1 and sys.argv[1] == "--approve":
-        approve_baseline()
+    pretty = "--pretty" in sys.argv[1:]
+    if "--approve" in sys.argv[1:]:
+        approve_baseline(pretty=pretty)
+    elif "--daemon" in sys.argv[1:]:
+        monitor_daemon(rescan="--rescan" in sys.argv[1:], pretty=pretty)
     else:
-        compare_baselines()
+        compare_baselines(rescan="--rescan" in sys.argv[1:], pretty=pretty)
+    flush_log()
 
 
 if __name__ == "__main__":